@@ -6,6 +6,7 @@ from unittest import mock
 import pytest
 import skein
 
+from tf_yarn._internal import reserve_sock_addr
 from tf_yarn.tensorflow import cluster
 from tf_yarn._task_commons import get_task_description
 
@@ -20,7 +21,17 @@ def test_aggregate_spec():
         "ps:0/init": "1.1.1.3:8888".encode()
     }
     client.kv = mock.MagicMock(spec=skein.kv.KeyValueStore)
-    client.kv.wait.side_effect = lambda arg: dict_sockaddr[arg]
+    # "ps:0" is already set, "worker:0" is set while subscribing to
+    # events and "worker:1" is received as an event
+    client.kv.transaction.side_effect = [
+        skein.kv.TransactionResult(True, [dict_sockaddr["ps:0/init"], None, None]),
+        skein.kv.TransactionResult(True, [dict_sockaddr["worker:0/init"], None])
+    ]
+    event_queue = client.kv.event_queue.return_value.__enter__.return_value
+    event_queue.get.side_effect = [
+        mock.Mock(key="worker:0/init", result=mock.Mock(value=dict_sockaddr["worker:0/init"])),
+        mock.Mock(key="worker:1/init", result=mock.Mock(value=dict_sockaddr["worker:1/init"]))
+    ]
 
     res = cluster.aggregate_spec(client, ["worker:1", "ps:0", "worker:0"])
     assert res == {"worker": ["1.1.1.1:8020", "1.1.1.2:4042"],
@@ -88,3 +99,14 @@ def test_start_tf_server(task_name, task_index, is_server_started):
             assert kwargs["start"] is True
         else:
             assert mock_server.Server.call_count == 0
+
+
+def test_start_tf_server_on_reserved_port():
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch.dict(os.environ))
+        os.environ["SKEIN_CONTAINER_ID"] = "worker_0"
+        os.environ.pop("TF_GRPC_REUSE_PORT", None)
+        _host, port = stack.enter_context(reserve_sock_addr())
+        server = cluster.start_tf_server({"worker": [f"localhost:{port}"]})
+        assert server is not None
+        assert server.target == f"grpc://localhost:{port}"
@@ -88,8 +88,8 @@ def test_wait_for_connected_tasks():
         tasks = ['task:1', 'task:2']
         message = 'tag'
         _wait_for_connected_tasks(None, tasks, None, message)
-        calls = [mock.call(None, f'{task}/{message}') for task in tasks]
-        mocked_event.wait.assert_has_calls(calls, any_order=True)
+        mocked_event.wait_all.assert_called_once_with(
+            None, [f'{task}/{message}' for task in tasks])
 
 
 def test__shutdown_container():
@@ -24,6 +24,15 @@ def test_monitored_thread():
     assert thread.exception.args == (42, )
 
 
+def test_monitored_thread_result():
+    thread = MonitoredThread(target=lambda x: x + 1, args=(41, ))
+    thread.start()
+    thread.join()
+
+    assert thread.exception is None
+    assert thread.result == 42
+
+
 def test_reserve_sock_addr():
     with reserve_sock_addr() as (host, port):
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
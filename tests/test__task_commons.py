@@ -1,12 +1,14 @@
 import contextlib
 from unittest import mock
 from unittest.mock import patch
+import zlib
+
 import pytest
 
 import cloudpickle
 import skein
 
-from tf_yarn._task_commons import _get_experiment
+from tf_yarn._task_commons import _get_experiment, _prefetch_experiment_fn
 
 
 MODULE_TO_TEST = "tf_yarn._task_commons"
@@ -19,11 +21,24 @@ def test__get_experiment_object():
     def experiment_f():
         return experiment_obj
 
-    mocked_client.kv.wait.return_value = cloudpickle.dumps(experiment_f)
+    mocked_client.kv.wait.return_value = zlib.compress(cloudpickle.dumps(experiment_f))
     returned_object = _get_experiment(mocked_client)
     assert returned_object == experiment_obj
 
 
+def test__get_experiment_prefetched():
+    mocked_client = mock.MagicMock(spec=skein.ApplicationClient)
+    experiment_obj = 'obj'
+
+    def experiment_f():
+        return experiment_obj
+
+    mocked_client.kv.wait.return_value = zlib.compress(cloudpickle.dumps(experiment_f))
+    get_experiment_fn = _prefetch_experiment_fn(mocked_client)
+    returned_object = _get_experiment(mocked_client, get_experiment_fn)
+    assert returned_object == experiment_obj
+
+
 def test__get_experiment_exception():
     with contextlib.ExitStack() as stack:
         stack.enter_context(patch(f'{MODULE_TO_TEST}.get_task'))
@@ -33,7 +48,7 @@ def test__get_experiment_exception():
         def experiment_f():
             raise Exception()
 
-        mocked_client.kv.wait.return_value = cloudpickle.dumps(experiment_f)
+        mocked_client.kv.wait.return_value = zlib.compress(cloudpickle.dumps(experiment_f))
         with pytest.raises(Exception):
             _get_experiment(mocked_client)
         mocked_event.start_event.assert_called_once()
@@ -1,4 +1,5 @@
 import json
+import os
 from unittest import mock
 import traceback
 
@@ -9,6 +10,9 @@ import tensorflow as tf
 from tf_yarn.tensorflow.experiment import Experiment
 from tf_yarn.tensorflow.keras_experiment import KerasExperiment
 from tf_yarn.client import (
+    _get_editable_requirements,
+    _list_editable_requirements,
+    _maybe_zip_task_files,
     _setup_cluster_spec,
     _setup_to_use_cuda_archive,
     get_safe_experiment_fn,
@@ -70,6 +74,41 @@ def test_setup_to_use_cuda_archive_without_env():
     assert actual_pre_script_hook == ""
 
 
+def test_maybe_zip_task_files(tmp_path):
+    package = tmp_path / "package"
+    package.mkdir()
+    (package / "module.py").write_text("a = 1")
+    single_file = tmp_path / "file.txt"
+    single_file.write_text("")
+
+    task_files = _maybe_zip_task_files({"package": str(package), "file": str(single_file)})
+    assert task_files["file"] == str(single_file)
+    assert task_files["package"].endswith("package.zip")
+
+    # The archive is reused as long as the directory is unchanged
+    assert _maybe_zip_task_files({"package": str(package)}) == \
+        {"package": task_files["package"]}
+
+    (package / "module.py").write_text("a = 42")
+    assert _maybe_zip_task_files({"package": str(package)}) != \
+        {"package": task_files["package"]}
+
+
+def test_get_editable_requirements(tmp_path, monkeypatch):
+    monkeypatch.setattr("sys.path", [str(tmp_path)])
+    _list_editable_requirements.cache_clear()
+    with mock.patch("tf_yarn.client.cluster_pack.get_editable_requirements") as mock_get:
+        mock_get.return_value = {"package": "/path/to/package"}
+        assert _get_editable_requirements() == {"package": "/path/to/package"}
+        assert _get_editable_requirements() == {"package": "/path/to/package"}
+        assert mock_get.call_count == 1
+
+        # Installing a package changes the mtime of its site directory
+        os.utime(tmp_path, ns=(0, 0))
+        _get_editable_requirements()
+        assert mock_get.call_count == 2
+
+
 def test_kill_skein_on_exception():
     def cloudpickle_raise_exception(*args, **kwargs):
         raise Exception("Cannot serialize your method!")
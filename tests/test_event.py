@@ -0,0 +1,66 @@
+import queue
+import typing
+from unittest import mock
+
+import skein
+
+from tf_yarn import event
+
+
+class FakeEventQueue:
+    """Deliver only the PUT events of the subscribed keys."""
+
+    def __init__(self, events: typing.List[typing.Tuple[str, bytes]]):
+        self.keys: typing.List[str] = []
+        self._events = events
+        self._queue: queue.Queue = queue.Queue()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def subscribe(self, key, event_type):
+        assert event_type == "PUT"
+        self.keys.append(key)
+
+    def get(self):
+        while self._queue.empty():
+            key, value = self._events.pop(0)
+            if key in self.keys:
+                self._queue.put(mock.Mock(key=key, result=mock.Mock(value=value)))
+        return self._queue.get()
+
+
+def test_wait_all():
+    client = mock.MagicMock(spec=skein.ApplicationClient)
+    client.kv = mock.MagicMock(spec=skein.kv.KeyValueStore)
+    # "worker:0" is already set, "worker:1" is set while subscribing and
+    # "worker:2" is set among unrelated keys while waiting
+    client.kv.transaction.side_effect = [
+        skein.kv.TransactionResult(True, [b"addr0", None, None]),
+        skein.kv.TransactionResult(True, [b"addr1", None])
+    ]
+    event_queue = FakeEventQueue([
+        ("worker:1/init", b"addr1"),
+        ("chief:0/logs", b"logs"),
+        ("evaluator:0/start", b""),
+        ("worker:2/init", b"addr2")
+    ])
+    client.kv.event_queue.return_value = event_queue
+
+    res = event.wait_all(client, ["worker:0/init", "worker:1/init", "worker:2/init"])
+    assert res == {"worker:0/init": "addr0",
+                   "worker:1/init": "addr1",
+                   "worker:2/init": "addr2"}
+    assert event_queue.keys == ["worker:1/init", "worker:2/init"]
+
+
+def test_wait_all_already_set():
+    client = mock.MagicMock(spec=skein.ApplicationClient)
+    client.kv = mock.MagicMock(spec=skein.kv.KeyValueStore)
+    client.kv.transaction.return_value = skein.kv.TransactionResult(True, [b"addr0"])
+
+    assert event.wait_all(client, ["worker:0/init"]) == {"worker:0/init": "addr0"}
+    client.kv.event_queue.assert_not_called()
@@ -3,6 +3,7 @@ import os
 import platform
 import socket
 from typing import (
+    Any,
     Optional,
     Tuple,
     List,
@@ -10,6 +11,7 @@ from typing import (
     Iterator
 )
 from contextlib import contextmanager
+from functools import lru_cache
 from threading import Thread
 
 
@@ -19,13 +21,14 @@ here = os.path.dirname(__file__)
 
 
 class MonitoredThread(Thread):
-    """A thread which captures any exception occurred during the
-    execution of ``target``.
+    """A thread which captures the value returned by ``target`` or any
+    exception occurred during its execution.
     """
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self._exc = None
+        self._result = None
 
     @property
     def state(self):
@@ -37,11 +40,19 @@ class MonitoredThread(Thread):
     def exception(self) -> Optional[Exception]:
         return self._exc
 
+    @property
+    def result(self) -> Any:
+        return self._result
+
     def run(self):
+        # Same as ``Thread.run`` but keeps the value returned by ``target``
         try:
-            super().run()
+            if self._target is not None:
+                self._result = self._target(*self._args, **self._kwargs)
         except Exception as exc:
             self._exc = exc
+        finally:
+            del self._target, self._args, self._kwargs
 
 
 def get_so_reuseport():
@@ -56,6 +67,15 @@ def get_so_reuseport():
     return None
 
 
+@lru_cache(maxsize=None)
+def get_fqdn() -> str:
+    """Fully qualified domain name of the host.
+
+    Cached as it requires a reverse DNS lookup.
+    """
+    return socket.getfqdn()
+
+
 @contextmanager
 def reserve_sock_addr() -> Iterator[Tuple[str, int]]:
     """Reserve an available TCP port to listen on.
@@ -64,8 +84,10 @@ def reserve_sock_addr() -> Iterator[Tuple[str, int]]:
     ``SO_REUSEPORT`` flag set (requires Linux >=3.9). The socket is
     then kept open until the generator is closed.
 
-    To reduce probability of 'hijacking' port, socket should stay open
-    and should be closed _just before_ starting of ``tf.train.Server``
+    To avoid 'hijacking' of the port, the socket should stay open until
+    ``tf.distribute.Server`` has bound the port. TensorFlow's gRPC server
+    only sets ``SO_REUSEPORT``, and can thus bind it, when the
+    ``TF_GRPC_REUSE_PORT`` environment variable is true.
     """
     so_reuseport = get_so_reuseport()
     if so_reuseport is None:
@@ -76,7 +98,7 @@ def reserve_sock_addr() -> Iterator[Tuple[str, int]]:
         sock.setsockopt(socket.SOL_SOCKET, so_reuseport, 1)
         sock.bind(("", 0))
         _ipaddr, port = sock.getsockname()
-        yield (socket.getfqdn(), port)
+        yield (get_fqdn(), port)
 
 
 def iter_tasks(tasks: List[Tuple[str, int]]) -> Iterable[str]:
@@ -2,13 +2,14 @@ import json
 import logging
 import os
 import typing
-from typing import List, NamedTuple
+import zlib
+from typing import Callable, List, NamedTuple, Optional
 
 import cloudpickle
 import skein
 
 from tf_yarn import event, constants
-from tf_yarn._internal import iter_tasks
+from tf_yarn._internal import iter_tasks, MonitoredThread
 
 
 def setup_logging():
@@ -35,11 +36,43 @@ def _get_cluster_tasks(
     return list(iter_tasks(json.loads(client.kv.wait(constants.KV_CLUSTER_INSTANCES).decode())))
 
 
-def _get_experiment(
+def _get_experiment_fn(
     client: skein.ApplicationClient
+) -> Callable:
+    return cloudpickle.loads(zlib.decompress(client.kv.wait(constants.KV_EXPERIMENT_FN)))
+
+
+def _prefetch_experiment_fn(
+    client: skein.ApplicationClient
+) -> Callable[[], Callable]:
+    """Fetch and unpickle the experiment function in the background.
+
+    Unpickling imports the modules the experiment function depends on,
+    this can overlap with waiting for the other tasks of the cluster.
+    The returned function waits for the experiment function and returns it.
+    """
+    thread = MonitoredThread(target=_get_experiment_fn, args=(client,), daemon=True)
+    thread.start()
+
+    def wait_experiment_fn():
+        thread.join()
+        if thread.exception is not None:
+            raise thread.exception
+        return thread.result
+
+    return wait_experiment_fn
+
+
+def _get_experiment(
+    client: skein.ApplicationClient,
+    get_experiment_fn: Optional[Callable[[], Callable]] = None
 ) -> NamedTuple:
     try:
-        experiment = cloudpickle.loads(client.kv.wait(constants.KV_EXPERIMENT_FN))()
+        if get_experiment_fn is None:
+            experiment_fn = _get_experiment_fn(client)
+        else:
+            experiment_fn = get_experiment_fn()
+        experiment = experiment_fn()
     except Exception as e:
         task = get_task()
         event.start_event(client, task)
@@ -1,3 +1,4 @@
+import atexit
 import importlib
 import logging.config
 import uuid
@@ -5,6 +6,9 @@ import os
 import tempfile
 import time
 import json
+import shutil
+import sys
+import zlib
 from typing import (
     Dict,
     Optional,
@@ -15,8 +19,10 @@ from typing import (
     List,
     Any
 )
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress, contextmanager
-from threading import Thread
+from functools import lru_cache, partial
+from threading import Lock, Thread
 from datetime import timedelta
 
 import cloudpickle
@@ -50,6 +56,12 @@ here = os.path.dirname(__file__)
 
 ExperimentFn = Callable[[], Any]
 
+# Archives of the directories shipped to the containers, along with the
+# fingerprint of the directory tree they were built from
+_zipped_dirs: Dict[str, Tuple[List[Tuple[str, int, int]], str]] = {}
+_zip_cache_dir: Optional[str] = None
+_zip_cache_dir_lock = Lock()
+
 
 class SkeinCluster(NamedTuple):
     client: skein.Client
@@ -107,13 +119,11 @@ def _setup_pyenvs(
 
 
 def _setup_task_env(
-        tempdir: str,
         files: Dict[str, str] = None,
         env: Dict[str, str] = {},
         n_try: int = 0
 ):
-    task_files = _maybe_zip_task_files(files or {}, tempdir)
-    task_files[__package__] = cluster_pack.zip_path(here, False, tempdir)
+    task_files = _maybe_zip_task_files({**(files or {}), __package__: here})
 
     _add_to_env(env, "LIBHDFS_OPTS", "-Xms64m -Xmx512m")
 
@@ -141,15 +151,66 @@ def _add_to_env(env: Dict[str, str], env_name: str, opts: str):
         env[env_name] = f"{opts}"
 
 
-def _maybe_zip_task_files(files, tempdir):
-    task_files = {}
-    for target, source in files.items():
-        assert target not in task_files
-        if os.path.isdir(source):
-            source = cluster_pack.zip_path(source, False, tempdir)
+def _maybe_zip_task_files(files):
+    # Directories are zipped concurrently: zlib releases the GIL while
+    # compressing.
+    dirs = {source for source in files.values() if os.path.isdir(source)}
+    if not dirs:
+        return dict(files)
+
+    # Created before starting the workers which all share it
+    cache_dir = _get_zip_cache_dir()
+    with ThreadPoolExecutor(max_workers=min(len(dirs), os.cpu_count() or 1)) as executor:
+        archives = dict(zip(dirs, executor.map(partial(_zip_dir, cache_dir=cache_dir), dirs)))
+    return {target: archives.get(source, source) for target, source in files.items()}
 
-        task_files[target] = source
-    return task_files
+
+def _zip_dir(source: str, cache_dir: str) -> str:
+    """Zip ``source``, reusing the archive of a previous launch if the
+    directory tree has not changed since.
+    """
+    fingerprint = _tree_fingerprint(source)
+    if source in _zipped_dirs:
+        previous_fingerprint, archive = _zipped_dirs[source]
+        if previous_fingerprint == fingerprint and os.path.exists(archive):
+            return archive
+        # The previous archive is left in place: a concurrent launch may
+        # still be uploading it. The cache directory is removed at exit.
+
+    # Each archive goes to its own directory as archives are named
+    # after the basename of the zipped directory
+    archive = cluster_pack.zip_path(source, False, tempfile.mkdtemp(dir=cache_dir))
+    _zipped_dirs[source] = (fingerprint, archive)
+    return archive
+
+
+def _tree_fingerprint(root: str) -> List[Tuple[str, int, int]]:
+    """Sorted ``(relative path, mtime in ns, size)`` of the files under ``root``.
+
+    ``os.scandir`` exposes the file type without an extra ``stat`` call,
+    and file contents are never read.
+    """
+    fingerprint = []
+    dirs = [root]
+    while dirs:
+        with os.scandir(dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif not entry.name.endswith(".pyc"):
+                    stat = entry.stat()
+                    fingerprint.append(
+                        (os.path.relpath(entry.path, root), stat.st_mtime_ns, stat.st_size))
+    return sorted(fingerprint)
+
+
+def _get_zip_cache_dir() -> str:
+    global _zip_cache_dir
+    with _zip_cache_dir_lock:
+        if _zip_cache_dir is None:
+            _zip_cache_dir = tempfile.mkdtemp(prefix="tf_yarn_")
+            atexit.register(shutil.rmtree, _zip_cache_dir, ignore_errors=True)
+        return _zip_cache_dir
 
 
 def _setup_to_use_cuda_archive(
@@ -202,64 +263,63 @@ def _setup_skein_cluster(
     if cuda_runtime_hdfs_path:
         pre_script_hook = _setup_to_use_cuda_archive(env, pre_script_hook, cuda_runtime_hdfs_path)
 
-    with tempfile.TemporaryDirectory() as tempdir:
-        task_files, task_env = _setup_task_env(tempdir, files, env, n_try)
-        services = {}
-        for task_type, task_spec in list(task_specs.items()):
-            pyenv = pyenvs[task_spec.label]
-            service_env = task_env.copy()
-            if task_spec.tb_termination_timeout_seconds >= 0:
-                service_env["TB_TERMINATION_TIMEOUT_SECONDS"] = \
-                    str(task_spec.tb_termination_timeout_seconds)
-            if task_spec.tb_model_dir:
-                service_env["TB_MODEL_DIR"] = str(task_spec.tb_model_dir)
-            if task_spec.tb_extra_args:
-                service_env["TB_EXTRA_ARGS"] = str(task_spec.tb_extra_args)
-
-            services[task_type] = skein.Service(
-                script=f'''
-                            set -x
-                            {pre_script_hook}
-                            {_env.gen_task_cmd(
-                                pyenv,
-                                task_type,
-                                custom_task_module)}
-                        ''',
-                resources=skein.model.Resources(task_spec.memory, task_spec.vcores),
-                max_restarts=0,
-                instances=task_spec.instances,
-                node_label=task_spec.label.value,
-                files={
-                    **task_files,
-                    pyenv.dest_path: pyenv.path_to_archive
-                },
-                env=service_env)
-
-        # on the cluster we don't ask again for delegation tokens
-        if "HADOOP_TOKEN_FILE_LOCATION" in os.environ:
-            file_systems = None
-
-        spec = skein.ApplicationSpec(
-            services,
-            queue=queue,
-            acls=acls,
-            file_systems=file_systems,
-            name=name
-        )
+    task_files, task_env = _setup_task_env(files, env, n_try)
+    services = {}
+    for task_type, task_spec in list(task_specs.items()):
+        pyenv = pyenvs[task_spec.label]
+        service_env = task_env.copy()
+        if task_spec.tb_termination_timeout_seconds >= 0:
+            service_env["TB_TERMINATION_TIMEOUT_SECONDS"] = \
+                str(task_spec.tb_termination_timeout_seconds)
+        if task_spec.tb_model_dir:
+            service_env["TB_MODEL_DIR"] = str(task_spec.tb_model_dir)
+        if task_spec.tb_extra_args:
+            service_env["TB_EXTRA_ARGS"] = str(task_spec.tb_extra_args)
+
+        services[task_type] = skein.Service(
+            script=f'''
+                        set -x
+                        {pre_script_hook}
+                        {_env.gen_task_cmd(
+                            pyenv,
+                            task_type,
+                            custom_task_module)}
+                    ''',
+            resources=skein.model.Resources(task_spec.memory, task_spec.vcores),
+            max_restarts=0,
+            instances=task_spec.instances,
+            node_label=task_spec.label.value,
+            files={
+                **task_files,
+                pyenv.dest_path: pyenv.path_to_archive
+            },
+            env=service_env)
+
+    # on the cluster we don't ask again for delegation tokens
+    if "HADOOP_TOKEN_FILE_LOCATION" in os.environ:
+        file_systems = None
+
+    spec = skein.ApplicationSpec(
+        services,
+        queue=queue,
+        acls=acls,
+        file_systems=file_systems,
+        name=name
+    )
 
-        if skein_client is None:
-            skein_client = skein.Client()
+    if skein_client is None:
+        skein_client = skein.Client()
 
-        task_instances = [(task_type, spec.instances) for task_type, spec in task_specs.items()]
-        events: Dict[str, Dict[str, str]] = \
-            {task: {} for task in _internal.iter_tasks(task_instances)}
-        app = skein_client.submit_and_connect(spec)
+    task_instances = [(task_type, spec.instances) for task_type, spec in task_specs.items()]
+    events: Dict[str, Dict[str, str]] = \
+        {task: {} for task in _internal.iter_tasks(task_instances)}
+    app = skein_client.submit_and_connect(spec)
 
-        # Start a thread which collects all events posted by all tasks in kv store
-        event_listener = Thread(target=_aggregate_events, args=(app.kv, events), daemon=True)
-        event_listener.start()
+    # Start a thread which collects all events posted by all tasks in kv store
+    event_listener = Thread(target=_aggregate_events, args=(app.kv, events), daemon=True)
+    event_listener.start()
 
-        return SkeinCluster(skein_client, app, task_instances, event_listener, events)
+    return SkeinCluster(skein_client, app, task_instances, event_listener, events)
 
 
 def _run_on_cluster(
@@ -269,7 +329,7 @@ def _run_on_cluster(
     n_try: int = 0
 ) -> Optional[metrics.Metrics]:
     # Attempt serialization early to avoid allocating unnecesary resources
-    serialized_fn = cloudpickle.dumps(experiment_fn)
+    serialized_fn = zlib.compress(cloudpickle.dumps(experiment_fn))
     with skein_cluster.client:
         return _execute_and_await_termination(
             skein_cluster,
@@ -480,7 +540,7 @@ def get_safe_experiment_fn(full_fn_name: str, *args):
 
 
 def _add_editable_requirements(files: Optional[Dict[str, str]]):
-    editable_requirements = cluster_pack.get_editable_requirements()
+    editable_requirements = _get_editable_requirements()
     if files is None:
         files = dict()
     for dirname, path in editable_requirements.items():
@@ -489,6 +549,29 @@ def _add_editable_requirements(files: Optional[Dict[str, str]]):
     return files
 
 
+def _get_editable_requirements() -> Dict[str, str]:
+    # Listing the packages of the python environment is slow. Installing
+    # or removing a package, editable or not, changes the mtime of the
+    # directory it is installed to, so the list is only refreshed then.
+    # The content of the editable packages is checked when zipping them.
+    return _list_editable_requirements(_sys_path_mtimes())
+
+
+@lru_cache(maxsize=1)
+def _list_editable_requirements(
+    sys_path_mtimes: Tuple[Tuple[str, int], ...]
+) -> Dict[str, str]:
+    return cluster_pack.get_editable_requirements()
+
+
+def _sys_path_mtimes() -> Tuple[Tuple[str, int], ...]:
+    mtimes = []
+    for path in sys.path:
+        with suppress(OSError):
+            mtimes.append((path, os.stat(path or ".").st_mtime_ns))
+    return tuple(mtimes)
+
+
 @contextmanager
 def _shutdown_on_exception(app: skein.ApplicationClient):
     # Ensure SIGINT is not masked to enable kill on C-c.
@@ -564,7 +647,12 @@ def _execute_and_await_termination(
         else:
             eval_metrics_logger.log()
             tensorboard_url_logger.log()
-        time.sleep(poll_every_secs)
+        if skein_cluster.event_listener.is_alive():
+            # The event listener stops once the application master is
+            # down, which wakes us up without waiting for the next poll
+            skein_cluster.event_listener.join(poll_every_secs)
+        else:
+            time.sleep(poll_every_secs)
         state = report.state
 
     result_metrics.log_mlflow(n_try)
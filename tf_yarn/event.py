@@ -12,10 +12,41 @@ def wait(client: skein.ApplicationClient, key: str) -> str:
     """
     Wait for a key
     """
-    _logger.info("Waiting for " + key)
+    _logger.info("Waiting for %s", key)
     return client.kv.wait(key).decode()
 
 
+def wait_all(client: skein.ApplicationClient, keys: typing.List[str]) -> typing.Dict[str, str]:
+    """
+    Wait for several keys
+
+    The keys already set are fetched in a single transaction. The missing
+    ones are then waited for through a single event queue, subscribed to
+    the PUT events of these keys only, rather than one wait per key.
+    """
+    values = _get_all(client, keys)
+    missing = set(keys) - values.keys()
+    if missing:
+        _logger.info("Waiting for %s", ", ".join(sorted(missing)))
+        with client.kv.event_queue() as event_queue:
+            for key in sorted(missing):
+                event_queue.subscribe(key=key, event_type="PUT")
+            # Fetch again once subscribed, in case a key was set meanwhile
+            values.update(_get_all(client, sorted(missing)))
+            missing -= values.keys()
+            while missing:
+                evt = event_queue.get()
+                if evt.key in missing:
+                    values[evt.key] = evt.result.value.decode()
+                    missing.remove(evt.key)
+    return {key: values[key] for key in keys}
+
+
+def _get_all(client: skein.ApplicationClient, keys: typing.List[str]) -> typing.Dict[str, str]:
+    result = client.kv.transaction(on_success=[skein.kv.get(key) for key in keys])
+    return {key: value.decode() for key, value in zip(keys, result.results) if value is not None}
+
+
 def logs_event(client: skein.ApplicationClient,
                task: str,
                logs: str) -> None:
@@ -70,7 +101,7 @@ def broadcast(
     key: str,
     value: str = ""
 ) -> None:
-    _logger.info(f"Broadcasting {key} = {value!r}")
+    _logger.info("Broadcasting %s = %r", key, value)
     try:
         client.kv[key] = value.encode()
     except AttributeError:
@@ -24,6 +24,8 @@ from tf_yarn.tensorflow import Experiment, TaskSpec, run_on_yarn
 
 USER = getpass.getuser()
 WINE_EQUALITY_FILE = f"{cluster_pack.get_default_fs()}/user/{USER}/tf_yarn_test/winequality-red.csv"
+# Copy of WINE_EQUALITY_FILE on the local disk of the container
+LOCAL_WINE_EQUALITY_FILE = "winequality-red.csv"
 # Output path of the learned model on hdfs
 HDFS_DIR = (f"{cluster_pack.get_default_fs()}/user/{USER}"
             f"/tf_yarn_test/tf_yarn_{int(datetime.now().timestamp())}")
@@ -33,21 +35,50 @@ def experiment_fn() -> Experiment:
     # To mitigate issue https://github.com/tensorflow/tensorflow/issues/32159 for tf >= 1.15
     import tensorflow as tf
 
+    # The input functions are called again for every evaluation: read the
+    # dataset from HDFS once and from the local disk afterwards
+    tf.io.gfile.copy(WINE_EQUALITY_FILE, LOCAL_WINE_EQUALITY_FILE, overwrite=True)
+
+    def dataset_options():
+        options = tf.data.Options()
+        options.experimental_optimization.shuffle_and_repeat_fusion = True
+        options.experimental_optimization.parallel_batch = True
+        return options
+
+    # The whole file is parsed at once and fits in memory: the datasets
+    # only shuffle and batch rows. Batches are prefetched to overlap input
+    # preparation with the training step. Keeping shuffle and repeat
+    # adjacent lets tf.data fuse them into a single op.
     def train_input_fn():
-        dataset = winequality.get_dataset(WINE_EQUALITY_FILE, split="train")
-        return (dataset.shuffle(1000)
-                .batch(128)
-                .repeat())
+        features, labels = winequality.load_numpy(LOCAL_WINE_EQUALITY_FILE, split="train")
+        dataset = tf.data.Dataset.from_tensor_slices((features, labels))
+        dataset = (dataset.shuffle(1000)
+                   .repeat()
+                   .batch(128)
+                   .prefetch(tf.data.experimental.AUTOTUNE))
+        return dataset.with_options(dataset_options())
 
     def eval_input_fn():
-        dataset = winequality.get_dataset(WINE_EQUALITY_FILE, split="test")
-        return (dataset.shuffle(1000)
-                .batch(128))
+        features, labels = winequality.load_numpy(LOCAL_WINE_EQUALITY_FILE, split="test")
+        dataset = tf.data.Dataset.from_tensor_slices((features, labels))
+        dataset = (dataset.shuffle(1000)
+                   .batch(128)
+                   .prefetch(tf.data.experimental.AUTOTUNE))
+        return dataset.with_options(dataset_options())
+
+    # The model is tiny, so kernel launches dominate: let XLA fuse them.
+    # Auto-clustering skips CPU devices unless TF_XLA_FLAGS enables the
+    # CPU JIT, which is set in the task environment below.
+    session_config = tf.compat.v1.ConfigProto(
+        graph_options=tf.compat.v1.GraphOptions(
+            optimizer_options=tf.compat.v1.OptimizerOptions(
+                global_jit_level=tf.compat.v1.OptimizerOptions.ON_1)))
 
     estimator = tf.estimator.LinearClassifier(
         feature_columns=winequality.get_feature_columns(),
         model_dir=HDFS_DIR,
-        n_classes=winequality.get_n_classes())
+        n_classes=winequality.get_n_classes(),
+        config=tf.estimator.RunConfig(session_config=session_config))
     return Experiment(
         estimator,
         tf.estimator.TrainSpec(train_input_fn, max_steps=100),
@@ -72,5 +103,6 @@ if __name__ == "__main__":
         },
         files={
             os.path.basename(winequality.__file__): winequality.__file__,
-        }
+        },
+        env={"TF_XLA_FLAGS": "--tf_xla_cpu_global_jit"}
     )
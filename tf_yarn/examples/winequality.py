@@ -1,5 +1,7 @@
 import typing
+import zlib
 
+import numpy as np
 import tensorflow as tf
 
 FEATURES = [
@@ -41,6 +43,32 @@ def get_dataset(
         raise ValueError("Unknown option split, must be 'train' or 'test'")
 
 
+def load_numpy(
+    path: str,
+    train_fraction: float = 0.7,
+    split: str = "train"
+) -> typing.Tuple[typing.Dict[str, np.ndarray], np.ndarray]:
+    """Parse all the rows of a split at once with ``numpy.loadtxt``.
+
+    The split is computed by hashing the raw lines.
+    """
+    if split not in ["train", "test"]:
+        raise ValueError("Unknown option split, must be 'train' or 'test'")
+
+    num_buckets = 1000
+    num_train_buckets = int(train_fraction * num_buckets)
+    in_training_set = split == "train"
+    with tf.io.gfile.GFile(path) as f:
+        lines = [
+            line for line in f.read().splitlines()[1:]
+            if (zlib.crc32(line.encode()) % num_buckets < num_train_buckets) == in_training_set
+        ]
+
+    data = np.loadtxt(lines, delimiter=";", dtype=np.float32, ndmin=2)
+    features = {name: data[:, i] for i, name in enumerate(FEATURES)}
+    return features, data[:, -1].astype(np.int32)
+
+
 def get_feature_columns():
     return [tf.feature_column.numeric_column(name) for name in FEATURES]
 
@@ -10,15 +10,21 @@ from tf_yarn import _internal
 from tf_yarn import event
 from tf_yarn._task_commons import get_task, get_task_description
 
+try:
+    import orjson
+except (ModuleNotFoundError, ImportError):
+    orjson = None  # type: ignore
+
 
 def aggregate_spec(client: skein.ApplicationClient,
                    all_tasks: typing.List[str]
                    ) -> typing.Dict[str, typing.List[str]]:
     spec: typing.Dict[str, typing.List[str]] = {}
-    for task in sorted(all_tasks, key=lambda x: int(x.split(':', 1)[1])):
-        sock_addr = event.wait(client, f"{task}/init")
+    tasks = sorted(all_tasks, key=lambda x: int(x.split(':', 1)[1]))
+    sock_addrs = event.wait_all(client, [f"{task}/init" for task in tasks])
+    for task in tasks:
         task_type, _task_id = task.split(":", 1)
-        spec.setdefault(task_type, []).append(sock_addr)
+        spec.setdefault(task_type, []).append(sock_addrs[f"{task}/init"])
     return spec
 
 
@@ -29,9 +35,10 @@ def start_cluster(
 ) -> typing.Dict[str, typing.List[str]]:
     # There is a race condition between acquiring a TCP port for
     # ``tf.train.Server``, and calling ``train_and_evaluate``.
-    # There is no TensorFlow API to get rid of the race condition
-    # completely, but the window of opportunity can be reduced by
-    # preempting the server.
+    # There is no TensorFlow API to hand a bound socket over to the
+    # server, but the tasks running a server avoid the race: the reserved
+    # socket stays open until the server has bound the port too, see
+    # ``start_tf_server``.
     # See https://github.com/tensorflow/tensorflow/issues/21492
     cluster_spec: typing.Dict = dict()
     host, port = host_port
@@ -45,13 +52,20 @@ def setup_tf_config(cluster_spec):
     # surprisingly does not follow the same code path as the rest
     # and spawns a server regardless of the "environment" value.
     task_type, task_id = get_task_description()
-    _internal.xset_environ(TF_CONFIG=json.dumps({
+    _internal.xset_environ(TF_CONFIG=_dumps({
         "cluster": cluster_spec,
         "environment": "google" if _is_fake_google_env(task_type) else "",
         "task": {"type": task_type, "index": task_id},
     }))
 
 
+def _dumps(obj: typing.Any) -> str:
+    # orjson is an optional, faster, drop-in replacement for json
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
 def start_tf_server(
     cluster_spec: typing.Dict[str, typing.List[str]],
     session_config: tf.compat.v1.ConfigProto = None
@@ -59,6 +73,10 @@ def start_tf_server(
 
     task_type, task_id = get_task_description()
     if _is_fake_google_env(task_type) and cluster_spec:
+        # The port is still held by the socket of ``reserve_sock_addr``.
+        # TensorFlow's gRPC server only sets SO_REUSEPORT, and can thus
+        # bind it too, when TF_GRPC_REUSE_PORT is true.
+        os.environ["TF_GRPC_REUSE_PORT"] = "true"
         server = tf.distribute.Server(
             tf.train.ClusterSpec(cluster_spec),
             job_name=task_type,
@@ -1,8 +1,11 @@
+import gc
 import logging
 
-from tf_yarn._task_commons import setup_logging, _get_experiment
+from tf_yarn._task_commons import setup_logging, _get_experiment, _prefetch_experiment_fn
 setup_logging()
 
+import skein
+
 from tf_yarn import _internal
 from tf_yarn.tensorflow import Experiment, KerasExperiment
 from tf_yarn.tensorflow.tasks.tf_task_common import (
@@ -13,32 +16,41 @@ from tf_yarn.tensorflow import cluster
 
 _logger = logging.getLogger(__name__)
 
+# Building and running a TensorFlow graph allocates many short-lived
+# Python objects, collect young generations less often
+gc.set_threshold(50000, 10, 10)
+
 
 def main() -> None:
     _log_sys_info()
     task_type, task_id = get_task_description()
+    client = skein.ApplicationClient.from_current()
+    # TensorFlow is already imported by the time we get here, but the
+    # modules the experiment function depends on can be imported while
+    # waiting for the other tasks
+    get_experiment_fn = _prefetch_experiment_fn(client)
     with _internal.reserve_sock_addr() as host_port:
-        client, cluster_spec, cluster_tasks = _prepare_container(host_port)
+        client, cluster_spec, cluster_tasks = _prepare_container(host_port, client)
         # Variable TF_CONFIG must be set before instantiating
         # the estimator to train in a distributed way
         cluster.setup_tf_config(cluster_spec)
-        experiment = _get_experiment(client)
+        experiment = _get_experiment(client, get_experiment_fn)
         if isinstance(experiment, Experiment):
             session_config = experiment.config.session_config
         elif isinstance(experiment, KerasExperiment):
             raise ValueError("KerasExperiment using parameter strategy is unsupported")
         else:
             raise ValueError("experiment must be an Experiment or a KerasExperiment")
-        _logger.info(f"Starting server {task_type}:{task_id}")
+        _logger.info("Starting server %s:%s", task_type, task_id)
+        cluster.start_tf_server(cluster_spec, session_config)
 
-    cluster.start_tf_server(cluster_spec, session_config)
     thread = _execute_dispatched_function(client, experiment)
 
     # "ps" tasks do not terminate by themselves. See
     # https://github.com/tensorflow/tensorflow/issues/4713.
     if task_type not in ['ps']:
         thread.join()
-        _logger.info(f"{task_type}:{task_id} {thread.state}")
+        _logger.info("%s:%s %s", task_type, task_id, thread.state)
 
     _shutdown_container(client, cluster_tasks, session_config, thread)
 
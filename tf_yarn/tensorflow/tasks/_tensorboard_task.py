@@ -42,7 +42,7 @@ def main() -> None:
         else:
             raise ValueError("experiment must be an Experiment or a KerasExperiment")
 
-    _logger.info(f"Starting tensorboard on {model_dir}")
+    _logger.info("Starting tensorboard on %s", model_dir)
 
     thread = _internal.MonitoredThread(
         name=f"{task_type}:{task_id}",
@@ -51,8 +51,7 @@ def main() -> None:
         daemon=True)
     thread.start()
 
-    for cluster_task in cluster_tasks:
-        event.wait(client, f"{cluster_task}/stop")
+    event.wait_all(client, [f"{cluster_task}/stop" for cluster_task in cluster_tasks])
 
     timeout = tensorboard.get_termination_timeout()
     thread.join(timeout)
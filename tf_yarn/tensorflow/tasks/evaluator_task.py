@@ -61,7 +61,7 @@ def keras_evaluate(experiment, stop_cond=None, timeout_in_secs=None):
 
         for ckpt in ckpt_to_eval:
             timestamp = datetime.now()
-            logger.info(f"Evaluating checkpoint {ckpt}")
+            logger.info("Evaluating checkpoint %s", ckpt)
             model = tf.keras.models.load_model(ckpt)
             model.evaluate(experiment.validation_data_fn())
 
@@ -79,7 +79,7 @@ def evaluate(experiment, stop_cond=None, timeout_in_secs=None):
 
     if len(evaluated_checkpoints) > 0:
         last_evaluated_checkpoint = max(evaluated_checkpoints)
-        logger.info(f"Last evaluated checkpoint: {last_evaluated_checkpoint}")
+        logger.info("Last evaluated checkpoint: %s", last_evaluated_checkpoint)
         if experiment.train_spec.max_steps and \
                 last_evaluated_checkpoint == experiment.train_spec.max_steps:
             logger.info(
@@ -99,7 +99,7 @@ def evaluate(experiment, stop_cond=None, timeout_in_secs=None):
 
         for ckpt in ckpt_to_eval:
             timestamp = datetime.now()
-            logger.info(f"Evaluating checkpoint {ckpt}")
+            logger.info("Evaluating checkpoint %s", ckpt)
             latest_eval_result = experiment.estimator.evaluate(
                 experiment.eval_spec.input_fn,
                 steps=experiment.eval_spec.steps,
@@ -121,8 +121,8 @@ def evaluate(experiment, stop_cond=None, timeout_in_secs=None):
                 )
 
         if len(ckpt_to_eval) == 0:
-            logger.info(f"No checkpoint to evaluate; Coming back to sleep "
-                        f"({experiment.eval_spec.throttle_secs} secs)")
+            logger.info("No checkpoint to evaluate; Coming back to sleep (%s secs)",
+                        experiment.eval_spec.throttle_secs)
 
         time.sleep(experiment.eval_spec.throttle_secs)
 
@@ -150,7 +150,7 @@ def main():
     if task_type == "evaluator":
         evaluator_fn(client)
     else:
-        logger.info(f"{task_type}:{task_id}: nothing to do")
+        logger.info("%s:%s: nothing to do", task_type, task_id)
 
     event.stop_event(client, task, None)
 
@@ -96,12 +96,13 @@ def _driver_fn(client, net_if):
     # Worker discovery
     worker_list = [f"{net_if[1]}:{N_PROCESS_PER_WORKER}"]
     n_workers = 1
-    for cluster_task in cluster_tasks:
-        if 'worker' in cluster_task:
-            worker_addr = event.wait(client, f"{cluster_task}/addr")
-            logger.info(f"{cluster_task}: {worker_addr}")
-            worker_list.append(f"{worker_addr}:{N_PROCESS_PER_WORKER}")
-            n_workers += 1
+    worker_tasks = [cluster_task for cluster_task in cluster_tasks if 'worker' in cluster_task]
+    worker_addrs = event.wait_all(client, [f"{worker_task}/addr" for worker_task in worker_tasks])
+    for worker_task in worker_tasks:
+        worker_addr = worker_addrs[f"{worker_task}/addr"]
+        logger.info("%s: %s", worker_task, worker_addr)
+        worker_list.append(f"{worker_addr}:{N_PROCESS_PER_WORKER}")
+        n_workers += 1
 
     # Worker task allocation to workers
     hosts = gloo_run.parse_hosts(','.join(worker_list))
@@ -135,7 +136,7 @@ def main():
     elif task_type == 'evaluator':
         evaluator_fn(client)
     else:
-        logger.error(f'Unknown task type {task_type}')
+        logger.error('Unknown task type %s', task_type)
 
     event.stop_event(client, task, None)
 
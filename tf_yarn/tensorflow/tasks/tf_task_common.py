@@ -19,10 +19,12 @@ _logger = logging.getLogger(__name__)
 
 
 def _prepare_container(
-    host_port: Tuple[str, int]
+    host_port: Tuple[str, int],
+    client: Optional[skein.ApplicationClient] = None
 ) -> Tuple[skein.ApplicationClient, Dict[str, List[str]], List[str]]:
     """Keep socket open while preparing container """
-    client = skein.ApplicationClient.from_current()
+    if client is None:
+        client = skein.ApplicationClient.from_current()
     _setup_container_logs(client)
     cluster_tasks = _get_cluster_tasks(client)
     cluster_spec = cluster.start_cluster(host_port, client, cluster_tasks)
@@ -30,9 +32,9 @@ def _prepare_container(
 
 
 def _log_sys_info() -> None:
-    _logger.info(f"Python {sys.version}")
-    _logger.info(f"Skein {skein.__version__}")
-    _logger.info(f"TensorFlow {tf.version.GIT_VERSION} {tf.version.VERSION}")
+    _logger.info("Python %s", sys.version)
+    _logger.info("Skein %s", skein.__version__)
+    _logger.info("TensorFlow %s %s", tf.version.GIT_VERSION, tf.version.VERSION)
 
 
 def _gen_monitored_train_and_evaluate(client: skein.ApplicationClient):
@@ -58,7 +60,7 @@ def _execute_dispatched_function(
     experiment: Union[Experiment, KerasExperiment]
 ) -> MonitoredThread:
     task_type, task_id = get_task_description()
-    _logger.info(f"Starting execution {task_type}:{task_id}")
+    _logger.info("Starting execution %s:%s", task_type, task_id)
     if isinstance(experiment, Experiment):
         thread = MonitoredThread(
             name=f"{task_type}:{task_id}",
@@ -101,9 +103,8 @@ def _shutdown_container(
 
 
 def _wait_for_connected_tasks(client, all_tasks, device_filters, message='stop'):
-    for task in all_tasks:
-        if _matches_device_filters(task, device_filters):
-            event.wait(client, f"{task}/{message}")
+    event.wait_all(client, [f"{task}/{message}" for task in all_tasks
+                            if _matches_device_filters(task, device_filters)])
 
 
 def _matches_device_filters(task: str, device_filters: List[str]):